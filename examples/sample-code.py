@@ -2,34 +2,67 @@
 Sample Python code for testing the code indexer
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable
+import functools
 import json
+import logging
+import re
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+logger = logging.getLogger(__name__)
 
 
 # Constants
 MAX_USERS = 1000
 DEFAULT_PAGE_SIZE = 20
+REPOSITORY_CACHE_SIZE = 1024
 
 
 # Module-level variables
 _global_cache = {}
 debug_mode = False
+_EMAIL_RE = re.compile(r'[^@]+@[^@]+\.[^@]+')
+_MISSING = object()
 
 
 class User:
     """Represents a user in the system"""
     
+    __slots__ = ('id', 'name', 'email', 'is_active', '_cached_repr')
+    
     def __init__(self, user_id: int, name: str, email: str):
         self.id = user_id
         self.name = name
         self.email = email
         self.is_active = True
+        self._cached_repr: Optional[tuple] = None
     
     def __str__(self) -> str:
-        return f"User({self.id}, {self.name}, {self.email})"
+        # Cached with the values it was built from, so in-place edits rebuild it
+        cached = self._cached_repr
+        if (cached is None or cached[0] is not self.id
+                or cached[1] is not self.name or cached[2] is not self.email):
+            text = f"User({self.id}, {self.name}, {self.email})"
+            cached = self._cached_repr = (self.id, self.name, self.email, text)
+        return cached[3]
     
-    def __repr__(self) -> str:
-        return self.__str__()
+    __repr__ = __str__
     
     def activate(self) -> None:
         """Activate the user"""
@@ -59,11 +92,137 @@ class User:
         return User(data['id'], data['name'], data['email'])
 
 
+def _check_user(user) -> None:
+    """Reject values the user store cannot index"""
+    if not isinstance(user, User):
+        raise TypeError(f"Expected User, got {type(user).__name__}")
+
+
+class _UserStore(dict):
+    """User map that keeps the active and email indexes in step with writes
+    
+    active maps the ids of active users to the users, in the order they were
+    stored (or last activated). by_email maps each email to one stored user
+    that has it.
+    """
+    
+    __slots__ = ('active', 'by_email')
+    
+    def __init__(self):
+        super().__init__()
+        self.active: Dict[int, User] = {}
+        self.by_email: Dict[str, User] = {}
+    
+    def __reduce__(self):
+        # Rebuild through __init__ and __setitem__ so the indexes are recreated
+        return (self.__class__, (), None, None, iter(self.items()))
+    
+    def set_active(self, user_id: int, active: bool) -> None:
+        """Record whether the user stored under user_id is active"""
+        if active:
+            self.active[user_id] = self[user_id]
+        else:
+            self.active.pop(user_id, None)
+    
+    def _indexed_email(self, user: User) -> Optional[str]:
+        """Email key pointing at user, which may predate an in-place edit"""
+        if self.by_email.get(user.email) is user:
+            return user.email
+        for email, indexed in self.by_email.items():
+            if indexed is user:
+                return email
+        return None
+    
+    def _refill_email(self, email: str) -> None:
+        """Point email at another stored user that has it, if any"""
+        # Fewer keys than users means some users share an email
+        if len(self.by_email) < len(self):
+            for other in self.values():
+                if other.email == email:
+                    self.by_email[email] = other
+                    return
+    
+    def replace(self, user_id: int, previous: Optional[User], user: User) -> None:
+        """Store user under user_id, given the user the caller already found there (or None)"""
+        _check_user(user)
+        dict.__setitem__(self, user_id, user)
+        self.set_active(user_id, user.is_active)
+        email = self._indexed_email(previous) if previous is not None else None
+        if email == user.email:
+            self.by_email[email] = user
+            return
+        if email is not None:
+            del self.by_email[email]
+        self.by_email.setdefault(user.email, user)
+        if email is not None:
+            self._refill_email(email)
+    
+    def __setitem__(self, user_id: int, user: User) -> None:
+        _check_user(user)
+        previous = self.get(user_id)
+        if previous is not None:
+            self.replace(user_id, previous, user)
+            return
+        # New key: nothing to unindex
+        dict.__setitem__(self, user_id, user)
+        if user.is_active:
+            self.active[user_id] = user
+        self.by_email.setdefault(user.email, user)
+    
+    def add_all(self, users: Iterable[User]) -> None:
+        """Store each user under its id, with the new-key path inlined"""
+        store_item = dict.__setitem__
+        active = self.active
+        by_email = self.by_email
+        for user in users:
+            if user is None:
+                raise ValueError("User cannot be None")
+            _check_user(user)
+            user_id = user.id
+            if user_id in self:
+                self.replace(user_id, self[user_id], user)
+                continue
+            store_item(self, user_id, user)
+            if user.is_active:
+                active[user_id] = user
+            if user.email not in by_email:
+                by_email[user.email] = user
+    
+    def _forget(self, user_id: int, user: User) -> None:
+        """Drop a user that was just removed from under user_id"""
+        self.active.pop(user_id, None)
+        email = self._indexed_email(user)
+        if email is not None:
+            del self.by_email[email]
+            self._refill_email(email)
+    
+    def __delitem__(self, user_id: int) -> None:
+        self._forget(user_id, super().pop(user_id))
+    
+    def pop(self, user_id: int, *default):
+        user = super().pop(user_id, _MISSING)
+        if user is _MISSING:
+            if default:
+                return default[0]
+            raise KeyError(user_id)
+        self._forget(user_id, user)
+        return user
+    
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError("_UserStore supports item assignment, del, pop, add_all and replace only")
+    
+    popitem = setdefault = clear = update = __ior__ = _unsupported
+
+
 class UserService:
-    """Service for managing users"""
+    """Service for managing users
+    
+    Change a stored user's state through activate_user/deactivate_user and its
+    fields through update_user so the lookup indexes stay current.
+    """
     
     def __init__(self):
-        self._users: Dict[int, User] = {}
+        self._users: _UserStore = _UserStore()
     
     def add_user(self, user: User) -> None:
         """Add a new user"""
@@ -71,31 +230,48 @@ class UserService:
             raise ValueError("User cannot be None")
         self._users[user.id] = user
     
+    def add_users(self, users: Iterable[User]) -> None:
+        """Add a batch of users without an add_user call per user"""
+        self._users.add_all(users)
+    
     def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
         return self._users.get(user_id)
     
     def update_user(self, user: User) -> None:
         """Update an existing user"""
-        if user.id not in self._users:
+        previous = self._users.get(user.id, _MISSING)
+        if previous is _MISSING:
             raise ValueError(f"User not found: {user.id}")
-        self._users[user.id] = user
+        self._users.replace(user.id, previous, user)
+    
+    def activate_user(self, user_id: int) -> None:
+        """Activate a stored user"""
+        user = self._users.get(user_id)
+        if user is None:
+            raise ValueError(f"User not found: {user_id}")
+        user.activate()
+        self._users.set_active(user_id, True)
+    
+    def deactivate_user(self, user_id: int) -> None:
+        """Deactivate a stored user"""
+        user = self._users.get(user_id)
+        if user is None:
+            raise ValueError(f"User not found: {user_id}")
+        user.deactivate()
+        self._users.set_active(user_id, False)
     
     def delete_user(self, user_id: int) -> None:
         """Delete a user"""
-        if user_id in self._users:
-            del self._users[user_id]
+        self._users.pop(user_id, None)
     
     def list_active_users(self) -> List[User]:
         """Get all active users"""
-        return [user for user in self._users.values() if user.is_active]
+        return list(self._users.active.values())
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Find user by email"""
-        for user in self._users.values():
-            if user.email == email:
-                return user
-        return None
+        return self._users.by_email.get(email)
     
     def count_users(self) -> int:
         """Count total users"""
@@ -104,9 +280,10 @@ class UserService:
 
 def validate_email(email: str) -> bool:
     """Validate an email address"""
-    return '@' in email and '.' in email
+    return _EMAIL_RE.match(email) is not None
 
 
+@functools.lru_cache(maxsize=8192)
 def format_user_name(name: str) -> str:
     """Format a user's name"""
     return name.strip().title()
@@ -125,23 +302,105 @@ def create_user(user_id: int, name: str, email: str) -> User:
 
 def process_users(service: UserService, users: List[User]) -> None:
     """Process a batch of users"""
-    for user in users:
-        service.add_user(user)
+    service.add_users(users)
+
+
+def _encode_user(obj) -> Dict:
+    """Serialize a User for the JSON encoder without building an intermediate list"""
+    if isinstance(obj, User):
+        return {
+            'id': obj.id,
+            'name': obj.name,
+            'email': obj.email,
+            'is_active': obj.is_active
+        }
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _scan_emails(buf, offsets, out) -> None:
+    """Check each email in a packed byte buffer in a single fused pass"""
+    for i in range(len(out)):
+        start = offsets[i]
+        end = offsets[i + 1]
+        at = -1
+        dot = False
+        valid = False
+        for j in range(start, end):
+            c = buf[j]
+            if c == 64:  # '@'
+                if at >= 0 or j == start:
+                    break
+                at = j
+            elif at >= 0:
+                if dot:
+                    valid = True
+                    break
+                if c == 46 and j > at + 1:  # '.'
+                    dot = True
+        out[i] = valid
+
+
+if njit is not None:
+    _scan_emails = njit(cache=True)(_scan_emails)
+
+
+def _validate_emails(emails: List[str]) -> List[bool]:
+    """Validate a batch of emails, using the packed scanner only when it is JIT-compiled"""
+    # Interpreted, the byte scanner is far slower than the per-item regex
+    if njit is None or np is None:
+        return [validate_email(email) for email in emails]
+    
+    encoded = [email.encode('utf-8') for email in emails]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    out = np.zeros(len(encoded), dtype=np.bool_)
+    _scan_emails(buf, offsets, out)
+    return out.tolist()
+
+
+def process_users_bulk(service: UserService, ids, names: List[str], emails: List[str]) -> None:
+    """Validate and add a batch of users given as parallel columns"""
+    if hasattr(ids, 'tolist'):
+        ids = ids.tolist()
+    
+    if not len(ids) == len(names) == len(emails):
+        raise ValueError(
+            f"Column lengths differ: {len(ids)} ids, {len(names)} names, {len(emails)} emails"
+        )
+    
+    for email, valid in zip(emails, _validate_emails(emails)):
+        if not valid:
+            raise ValueError(f"Invalid email: {email}")
+    
+    formatted_names = [format_user_name(name) for name in names]
+    service.add_users([
+        User(user_id, name, email)
+        for user_id, name, email in zip(ids, formatted_names, emails)
+    ])
 
 
 def save_users_to_file(service: UserService, filename: str) -> None:
     """Save users to a JSON file"""
     users = service.list_active_users()
-    data = [user.to_dict() for user in users]
+    
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(users, default=_encode_user, option=orjson.OPT_INDENT_2))
+        return
     
     with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(users, default=_encode_user, indent=2))
 
 
 def load_users_from_file(filename: str) -> List[User]:
     """Load users from a JSON file"""
-    with open(filename, 'r') as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(filename, 'r') as f:
+            data = json.loads(f.read())
     
     return [User.from_dict(item) for item in data]
 
@@ -149,23 +408,35 @@ def load_users_from_file(filename: str) -> List[User]:
 class UserRepository:
     """Repository for user persistence"""
     
-    def __init__(self, service: UserService):
+    __slots__ = ('service', '_cache', '_cache_max')
+    
+    def __init__(self, service: UserService, cache_size: int = REPOSITORY_CACHE_SIZE):
         self.service = service
-        self._cache = {}
+        self._cache: 'OrderedDict[int, User]' = OrderedDict()
+        self._cache_max = cache_size
+    
+    def _remember(self, user: User) -> None:
+        """Cache a user, evicting the least recently used entry when full"""
+        self._cache[user.id] = user
+        self._cache.move_to_end(user.id)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
     
     def save(self, user: User) -> None:
         """Save user"""
         self.service.add_user(user)
-        self._cache[user.id] = user
+        self._remember(user)
     
     def find_by_id(self, user_id: int) -> Optional[User]:
         """Find user by ID"""
-        if user_id in self._cache:
-            return self._cache[user_id]
+        user = self._cache.get(user_id)
+        if user is not None:
+            self._cache.move_to_end(user_id)
+            return user
         
         user = self.service.get_user(user_id)
         if user:
-            self._cache[user_id] = user
+            self._remember(user)
         return user
     
     def find_all(self) -> List[User]:
@@ -176,17 +447,24 @@ class UserRepository:
 class AdminUser(User):
     """Admin user with additional privileges"""
     
+    __slots__ = ('role',)
+    
     def __init__(self, user_id: int, name: str, email: str, role: str = "admin"):
-        super().__init__(user_id, name, email)
+        # Mirrors User.__init__ inline to avoid the super() call on bulk creation
+        self.id = user_id
+        self.name = name
+        self.email = email
+        self.is_active = True
+        self._cached_repr: Optional[tuple] = None
         self.role = role
     
     def grant_permission(self, permission: str) -> None:
         """Grant a permission to the admin"""
-        print(f"Granting {permission} to {self.name}")
+        logger.debug("Granting %s to %s", permission, self.name)
     
     def revoke_permission(self, permission: str) -> None:
         """Revoke a permission from the admin"""
-        print(f"Revoking {permission} from {self.name}")
+        logger.debug("Revoking %s from %s", permission, self.name)
 
 
 def create_admin_user(user_id: int, name: str, email: str) -> AdminUser:
@@ -197,11 +475,15 @@ def create_admin_user(user_id: int, name: str, email: str) -> AdminUser:
 
 # Decorator example
 def log_calls(func):
-    """Decorator to log function calls"""
+    """Decorator to log function calls (no-op unless debug_mode is set)"""
+    if not debug_mode:
+        return func
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__}")
+        logger.debug("Calling %s", func.__name__)
         result = func(*args, **kwargs)
-        print(f"Finished {func.__name__}")
+        logger.debug("Finished %s", func.__name__)
         return result
     return wrapper
 
@@ -218,15 +500,17 @@ def process_user_batch(users: List[User]) -> int:
 class UserSession:
     """Context manager for user sessions"""
     
+    __slots__ = ('user',)
+    
     def __init__(self, user: User):
         self.user = user
     
     def __enter__(self):
-        print(f"Starting session for {self.user.name}")
+        logger.debug("Starting session for %s", self.user.name)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        print(f"Ending session for {self.user.name}")
+        logger.debug("Ending session for %s", self.user.name)
         return False
 
 
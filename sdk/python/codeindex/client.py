@@ -13,6 +13,10 @@ from .exceptions import DatabaseNotFoundError
 from .embeddings_generator import EmbeddingsGenerator
 
 
+def _already_connected() -> None:
+    """Stand-in for CodeIndexClient._ensure_connected once connected"""
+
+
 class CodeIndexClient:
     """Client for querying CodeIndex SQLite database"""
     
@@ -56,6 +60,8 @@ class CodeIndexClient:
         if not self._db or not self._query:
             self._db = CodeIndexDatabase(self.db_path)
             self._query = CodeIndexQuery(self._db)
+        # Skip the check on later calls until close() drops the connection
+        self._ensure_connected = _already_connected
     
     def _load_config(self) -> Optional[Dict[str, Any]]:
         """Load configuration from codeindex.config.json if exists"""
@@ -177,6 +183,7 @@ class CodeIndexClient:
             self._db.close()
             self._db = None
             self._query = None
+        self.__dict__.pop('_ensure_connected', None)
     
     def find_symbols(
         self,
@@ -245,6 +252,32 @@ class CodeIndexClient:
         
         return self._query.find_symbol(name, language, in_file, kind)
     
+    def find_symbols_bulk(self, queries: list[Dict[str, Any]]) -> list[Optional[Dict[str, Any]]]:
+        """
+        Find a single symbol for each of several queries in one lookup
+        
+        Args:
+            queries: List of query dicts with 'name' and optional
+                'language', 'inFile' (or 'in_file') and 'kind'
+        
+        Returns:
+            List of symbol dictionaries (or None), in query order
+        """
+        self._ensure_connected()
+        
+        normalized = []
+        for query in queries:
+            if not query.get('name'):
+                raise ValueError("name parameter is required")
+            normalized.append({
+                'name': query['name'],
+                'language': query.get('language'),
+                'inFile': query.get('inFile', query.get('in_file')),
+                'kind': query.get('kind'),
+            })
+        
+        return self._query.find_symbols_bulk(normalized)
+    
     def object_properties(
         self,
         object_name: str,
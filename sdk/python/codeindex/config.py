@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Any
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
 
 
 @dataclass
@@ -21,6 +27,17 @@ class CodeIndexConfig:
     embedding_options: Optional[Dict[str, Any]] = None
     extra: Dict[str, Any] = field(default_factory=dict)
     
+    # (attribute, payload key, convert to list) for optional legacy fields
+    _PAYLOAD_MAP: ClassVar[Tuple[Tuple[str, str, bool], ...]] = (
+        ("root_dir", "rootDir", False),
+        ("languages", "languages", True),
+        ("include", "include", True),
+        ("exclude", "exclude", True),
+        ("batch_interval_minutes", "batchIntervalMinutes", False),
+        ("min_change_lines", "minChangeLines", False),
+        ("embedding_options", "embeddingOptions", False),
+    )
+    
     def __post_init__(self):
         """Validate configuration"""
         if not self.db_path:
@@ -38,22 +55,21 @@ class CodeIndexConfig:
         }
         
         # Include legacy fields for compatibility
-        if self.root_dir is not None:
-            payload["rootDir"] = self.root_dir
-        if self.languages is not None:
-            payload["languages"] = list(self.languages)
-        if self.include is not None:
-            payload["include"] = list(self.include)
-        if self.exclude is not None:
-            payload["exclude"] = list(self.exclude)
-        if self.batch_interval_minutes is not None:
-            payload["batchIntervalMinutes"] = self.batch_interval_minutes
-        if self.min_change_lines is not None:
-            payload["minChangeLines"] = self.min_change_lines
-        if self.embedding_options is not None:
-            payload["embeddingOptions"] = self.embedding_options
+        payload.update({
+            key: list(value) if as_list else value
+            for attr, key, as_list in self._PAYLOAD_MAP
+            if (value := getattr(self, attr)) is not None
+        })
         
         if self.extra:
             payload.update(self.extra)
         
         return payload
+    
+    def to_payload_bytes(self) -> bytes:
+        """Serialize to_payload() as UTF-8 JSON bytes (uses orjson when installed)"""
+        payload = self.to_payload()
+        if orjson is not None:
+            # Stringify non-str keys (e.g. in extra) the way json.dumps does
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload).encode("utf-8")
@@ -8,6 +8,10 @@ from .types import FileRecord, SymbolRecord, CallRecord, ReferenceRecord, Locati
 from .exceptions import DatabaseNotFoundError, DatabaseError
 
 
+# Bound parameters per statement on SQLite builds older than 3.32
+SQLITE_MAX_VARIABLES = 999
+
+
 class CodeIndexDatabase:
     """Direct access to CodeIndex SQLite database"""
     
@@ -124,6 +128,25 @@ class CodeIndexDatabase:
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to find symbols by name: {e}") from e
     
+    def find_symbols_by_names(self, names: List[str]) -> List[SymbolRecord]:
+        """Find symbols matching any of the given names, batching the IN list"""
+        symbols: List[SymbolRecord] = []
+        try:
+            for start in range(0, len(names), SQLITE_MAX_VARIABLES):
+                chunk = names[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = self.conn.execute(
+                    f"""SELECT symbol_id, file_id, language, kind, name, qualified_name,
+                               start_line, start_col, end_line, end_col, signature, exported,
+                               chunk_hash, chunk_summary, summary_tokens, summarized_at
+                        FROM symbols WHERE name IN ({placeholders})""",
+                    tuple(chunk)
+                )
+                symbols.extend(self._row_to_symbol(row) for row in cursor.fetchall())
+            return symbols
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to find symbols by names: {e}") from e
+    
     def get_symbol_by_id(self, symbol_id: int) -> Optional[SymbolRecord]:
         """Get symbol by ID"""
         try:
@@ -17,6 +17,11 @@ from .exceptions import (
     RequestTimeoutError,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖
+    orjson = None
+
 
 class NodeWorker:
     """通过 stdin/stdout 与 Node Worker 通信"""
@@ -85,9 +90,20 @@ class NodeWorker:
         with self._lock:
             self._req_id += 1
             req_id = self._req_id
-            payload = json.dumps({"id": req_id, "method": method, "params": params})
-            self._proc.stdin.write(payload + "\n")
-            self._proc.stdin.flush()
+            message_obj = {"id": req_id, "method": method, "params": params}
+            if orjson is not None:
+                # 文本管道为 write_through，可直接写入底层字节流；
+                # OPT_NON_STR_KEYS 与 json.dumps 一样将非字符串键转为字符串
+                self._proc.stdin.buffer.write(
+                    orjson.dumps(
+                        message_obj,
+                        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+                self._proc.stdin.buffer.flush()
+            else:
+                self._proc.stdin.write(json.dumps(message_obj) + "\n")
+                self._proc.stdin.flush()
 
             start = time.time()
             while True:
@@ -99,7 +115,7 @@ class NodeWorker:
                     raise WorkerCrashedError("Worker stdout 已关闭")
 
                 try:
-                    message = json.loads(line)
+                    message = orjson.loads(line) if orjson is not None else json.loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -21,7 +21,31 @@ class CodeIndexQuery:
     ) -> Optional[Dict[str, Any]]:
         """Find a single symbol matching criteria"""
         symbols = self.db.find_symbols_by_name(name, language)
+        return self._pick_symbol(symbols, in_file, kind)
+    
+    def find_symbols_bulk(self, queries: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Resolve several find_symbol queries with a single symbol lookup"""
+        names = list({query['name'] for query in queries})
+        by_name: Dict[str, List[SymbolRecord]] = {}
+        for symbol in self.db.find_symbols_by_names(names):
+            by_name.setdefault(symbol.name, []).append(symbol)
         
+        results = []
+        for query in queries:
+            symbols = by_name.get(query['name'], [])
+            language = query.get('language')
+            if language:
+                symbols = [s for s in symbols if s.language == language]
+            results.append(self._pick_symbol(symbols, query.get('inFile'), query.get('kind')))
+        return results
+    
+    def _pick_symbol(
+        self,
+        symbols: List[SymbolRecord],
+        in_file: Optional[str] = None,
+        kind: Optional[SymbolKind] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Narrow candidate symbols by file and kind and return the first match"""
         if not symbols:
             return None
         
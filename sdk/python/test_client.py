@@ -172,13 +172,10 @@ def test_object_properties(client: CodeIndexClient):
             print_error(f"查询失败 {case['object']}: {e}")
 
 
-def test_definition(client: CodeIndexClient):
+def test_definition(client: CodeIndexClient, symbol: Optional[dict]):
     """测试获取定义位置"""
     print_test("获取定义位置（definition）")
     
-    # 先找到一个符号
-    symbol = client.find_symbol(name="GatewayConfig", language="go")
-    
     if not symbol or not symbol.get('symbolId'):
         print_warning("需要先找到符号才能测试定义位置")
         return
@@ -194,13 +191,10 @@ def test_definition(client: CodeIndexClient):
         print_error(f"获取定义位置失败: {e}")
 
 
-def test_references(client: CodeIndexClient):
+def test_references(client: CodeIndexClient, symbol: Optional[dict]):
     """测试获取引用"""
     print_test("获取引用（references）")
     
-    # 先找到一个符号
-    symbol = client.find_symbol(name="gateway", language="go")
-    
     if not symbol or not symbol.get('symbolId'):
         print_warning("需要先找到符号才能测试引用")
         return
@@ -218,13 +212,10 @@ def test_references(client: CodeIndexClient):
         print_error(f"获取引用失败: {e}")
 
 
-def test_call_chain(client: CodeIndexClient):
+def test_call_chain(client: CodeIndexClient, symbol: Optional[dict]):
     """测试构建调用链"""
     print_test("构建调用链（call_chain）")
     
-    # 先找到一个符号
-    symbol = client.find_symbol(name="StartGatewayFromConfig", language="go")
-    
     if not symbol or not symbol.get('symbolId'):
         print_warning("需要先找到符号才能测试调用链")
         return
@@ -293,9 +284,15 @@ def run_all_tests():
         test_object_properties(client)
         
         print_section("高级功能测试")
-        test_definition(client)
-        test_references(client)
-        test_call_chain(client)
+        # 一次批量查询取回后续测试需要的符号
+        definition_sym, references_sym, call_chain_sym = client.find_symbols_bulk([
+            {"name": "GatewayConfig", "language": "go"},
+            {"name": "gateway", "language": "go"},
+            {"name": "StartGatewayFromConfig", "language": "go"},
+        ])
+        test_definition(client, definition_sym)
+        test_references(client, references_sym)
+        test_call_chain(client, call_chain_sym)
         
         print_section("兼容性测试")
         test_config_compatibility()
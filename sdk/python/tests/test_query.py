@@ -0,0 +1,121 @@
+"""Tests for CodeIndexQuery against a small on-disk index"""
+
+import sqlite3
+
+import pytest
+
+from codeindex import CodeIndexClient
+from codeindex import database
+
+
+SCHEMA = """
+CREATE TABLE files (
+    file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    language TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE symbols (
+    symbol_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    qualified_name TEXT NOT NULL,
+    start_line INTEGER NOT NULL,
+    start_col INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    end_col INTEGER NOT NULL,
+    signature TEXT,
+    exported INTEGER DEFAULT 0,
+    chunk_hash TEXT,
+    chunk_summary TEXT,
+    summary_tokens INTEGER,
+    summarized_at INTEGER
+);
+"""
+
+FILES = [
+    (1, "pkg/gateway/config.go", "go"),
+    (2, "pkg/server/main.go", "go"),
+    (3, "app/main.py", "python"),
+]
+
+# (file_id, language, kind, name)
+SYMBOLS = [
+    (1, "go", "struct", "GatewayConfig"),
+    (1, "go", "function", "main"),
+    (2, "go", "function", "main"),
+    (2, "go", "variable", "gateway"),
+    (3, "python", "function", "main"),
+    (3, "python", "class", "main"),
+    (3, "python", "class", "GatewayConfig"),
+]
+
+
+@pytest.fixture
+def client(tmp_path):
+    db_path = tmp_path / "index.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO files (file_id, path, language, content_hash, mtime, size) "
+        "VALUES (?, ?, ?, 'hash', 0, 0)",
+        FILES,
+    )
+    conn.executemany(
+        "INSERT INTO symbols (file_id, language, kind, name, qualified_name, "
+        "start_line, start_col, end_line, end_col) VALUES (?, ?, ?, ?, ?, 1, 0, 2, 0)",
+        [(f, lang, kind, name, f"{f}.{name}") for f, lang, kind, name in SYMBOLS],
+    )
+    conn.commit()
+    conn.close()
+
+    with CodeIndexClient(str(db_path)) as c:
+        yield c
+
+
+QUERIES = [
+    {"name": "GatewayConfig"},
+    {"name": "GatewayConfig", "language": "go"},
+    {"name": "GatewayConfig", "language": "python"},
+    {"name": "main", "kind": "class"},
+    {"name": "main", "language": "go", "inFile": "server/"},
+    {"name": "main", "language": "go", "kind": "function"},
+    {"name": "main", "in_file": "app/", "kind": "function"},
+    {"name": "gateway", "language": "go"},
+    {"name": "gateway", "language": "python"},
+    {"name": "missing"},
+]
+
+
+def test_find_symbols_bulk_matches_find_symbol(client):
+    expected = [
+        client.find_symbol(
+            name=q["name"],
+            language=q.get("language"),
+            in_file=q.get("inFile", q.get("in_file")),
+            kind=q.get("kind"),
+        )
+        for q in QUERIES
+    ]
+
+    assert client.find_symbols_bulk(QUERIES) == expected
+    assert expected[-1] is None
+    assert expected[2]["location"]["path"] == "app/main.py"
+    assert expected[4]["location"]["path"] == "pkg/server/main.go"
+
+
+def test_find_symbols_bulk_splits_large_name_lists(client, monkeypatch):
+    monkeypatch.setattr(database, "SQLITE_MAX_VARIABLES", 2)
+    queries = [{"name": f"unknown{i}"} for i in range(5)] + QUERIES
+
+    expected = [None] * 5 + client.find_symbols_bulk(QUERIES)
+    assert client.find_symbols_bulk(queries) == expected
+
+
+def test_find_symbols_bulk_requires_name(client):
+    with pytest.raises(ValueError):
+        client.find_symbols_bulk([{"language": "go"}])